@@ -24,7 +24,9 @@ Authentication:
     await client.login("user@example.com", "password")
 """
 
-from .client import GoatflowClient
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
 from .exceptions import (
     GoatflowError,
     ValidationError,
@@ -35,31 +37,71 @@ from .exceptions import (
     ForbiddenError,
     RateLimitError,
 )
-from .models import (
-    Ticket,
-    TicketMessage,
-    User,
-    Queue,
-    Attachment,
-    Group,
-    DashboardStats,
-    SearchResult,
-    InternalNote,
-    NoteTemplate,
-    LDAPUser,
-    LDAPSyncResult,
-    Webhook,
-    WebhookDelivery,
-    TicketCreateRequest,
-    TicketUpdateRequest,
-    TicketListOptions,
-    MessageCreateRequest,
-    UserCreateRequest,
-    UserUpdateRequest,
-    AuthLoginRequest,
-    AuthLoginResponse,
-)
-from .auth import APIKeyAuth, JWTAuth, OAuth2Auth
+
+if TYPE_CHECKING:
+    from .client import GoatflowClient
+    from .models import (
+        Ticket,
+        TicketMessage,
+        User,
+        Queue,
+        Attachment,
+        Group,
+        DashboardStats,
+        SearchResult,
+        InternalNote,
+        NoteTemplate,
+        LDAPUser,
+        LDAPSyncResult,
+        Webhook,
+        WebhookDelivery,
+        TicketCreateRequest,
+        TicketUpdateRequest,
+        TicketListOptions,
+        MessageCreateRequest,
+        UserCreateRequest,
+        UserUpdateRequest,
+        AuthLoginRequest,
+        AuthLoginResponse,
+        TicketListAdapter,
+        TicketListTicketsAdapter,
+        UserAdapter,
+    )
+    from .auth import APIKeyAuth, JWTAuth, OAuth2Auth
+
+# Public names that live in heavier submodules (pydantic, httpx), mapped to
+# the module that defines them. They are imported on first attribute access.
+_LAZY_ATTRS: Dict[str, str] = {
+    "GoatflowClient": ".client",
+    "Ticket": ".models",
+    "TicketMessage": ".models",
+    "User": ".models",
+    "Queue": ".models",
+    "Attachment": ".models",
+    "Group": ".models",
+    "DashboardStats": ".models",
+    "SearchResult": ".models",
+    "InternalNote": ".models",
+    "NoteTemplate": ".models",
+    "LDAPUser": ".models",
+    "LDAPSyncResult": ".models",
+    "Webhook": ".models",
+    "WebhookDelivery": ".models",
+    "TicketCreateRequest": ".models",
+    "TicketUpdateRequest": ".models",
+    "TicketListOptions": ".models",
+    "MessageCreateRequest": ".models",
+    "UserCreateRequest": ".models",
+    "UserUpdateRequest": ".models",
+    "AuthLoginRequest": ".models",
+    "AuthLoginResponse": ".models",
+    "TicketListAdapter": ".models",
+    "TicketListTicketsAdapter": ".models",
+    "UserAdapter": ".models",
+    "APIKeyAuth": ".auth",
+    "JWTAuth": ".auth",
+    "OAuth2Auth": ".auth",
+}
 
 __version__ = "1.0.0"
 __author__ = "GoatFlow Team"
@@ -101,13 +143,56 @@ __all__ = [
     "UserUpdateRequest",
     "AuthLoginRequest",
     "AuthLoginResponse",
+    # Validators
+    "TicketListAdapter",
+    "TicketListTicketsAdapter",
+    "UserAdapter",
     # Auth
     "APIKeyAuth",
     "JWTAuth",
     "OAuth2Auth",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import client, model and auth symbols on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported public names in dir()."""
+    return sorted(set(globals()) | set(__all__))
+
 # Convenience functions for error checking
+_ERROR_KINDS: Dict[type, str] = {
+    NotFoundError: "not_found",
+    UnauthorizedError: "unauthorized",
+    ForbiddenError: "forbidden",
+    RateLimitError: "rate_limit",
+    ValidationError: "validation",
+    TimeoutError: "timeout",
+    NetworkError: "network",
+    GoatflowError: "goatflow",
+}
+
+
+def error_kind(error: Exception) -> Optional[str]:
+    """Classify an exception, e.g. ``"not_found"``, or None for non-GoatFlow errors.
+
+    Exact SDK exception types resolve with one dict lookup; subclasses fall
+    back to the nearest mapped base class.
+    """
+    for cls in type(error).__mro__:
+        kind = _ERROR_KINDS.get(cls)
+        if kind is not None:
+            return kind
+    return None
+
 def is_goatflow_error(error: Exception) -> bool:
     """Check if an exception is a GoatFlow API error."""
     return isinstance(error, GoatflowError)
@@ -1,8 +1,9 @@
 """Authentication classes for the GoatFlow SDK."""
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional, Dict, Any, Callable, Awaitable, Union
 
 from .exceptions import AuthenticationError
@@ -85,7 +86,7 @@ class JWTAuth(Authenticator):
             return False
         
         # Add 1 minute buffer
-        buffer_time = datetime.now(timezone.utc).timestamp() + 60
+        buffer_time = time.time() + 60
         return self.expires_at.timestamp() <= buffer_time
     
     async def refresh(self) -> None:
@@ -149,7 +150,7 @@ class OAuth2Auth(Authenticator):
             return False
         
         # Add 1 minute buffer
-        buffer_time = datetime.now(timezone.utc).timestamp() + 60
+        buffer_time = time.time() + 60
         return self.expires_at.timestamp() <= buffer_time
     
     async def refresh(self) -> None:
@@ -1,11 +1,12 @@
 """HTTP client for the GoatFlow SDK."""
 
 import asyncio
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union, Type, TypeVar, List
 from urllib.parse import urljoin, urlencode
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from .auth import Authenticator, NoAuth
 from .exceptions import (
@@ -23,6 +24,12 @@ from .models import APIResponse
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[BaseModel]) -> TypeAdapter[Any]:
+    """Return a cached validator for a list of ``model_class`` items."""
+    return TypeAdapter(List[model_class])  # type: ignore[valid-type]
+
+
 class HTTPClient:
     """HTTP client for making requests to the GoatFlow API."""
     
@@ -215,7 +222,7 @@ class HTTPClient:
         # Parse with Pydantic model if provided
         if model_class and result_data is not None:
             if isinstance(result_data, list):
-                return [model_class.model_validate(item) for item in result_data]
+                return _list_adapter(model_class).validate_python(result_data)
             else:
                 return model_class.model_validate(result_data)
         
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation, TypeAdapter
 
 
 class BaseGoatflowModel(BaseModel):
@@ -17,7 +17,20 @@ class BaseGoatflowModel(BaseModel):
     )
 
 
-class Ticket(BaseGoatflowModel):
+class BaseGoatflowResponse(BaseGoatflowModel):
+    """Base model for data returned by the GoatFlow API.
+
+    Response models are parsed in bulk and rarely mutated, so assignment
+    validation is disabled and unknown fields from newer servers are ignored.
+    """
+    
+    model_config = ConfigDict(
+        validate_assignment=False,
+        extra="ignore",
+    )
+
+
+class Ticket(BaseGoatflowResponse):
     """Represents a support ticket."""
     
     id: int
@@ -34,7 +47,7 @@ class Ticket(BaseGoatflowModel):
     updated_at: datetime
     closed_at: Optional[datetime] = None
     tags: Optional[List[str]] = None
-    custom_fields: Optional[Dict[str, Any]] = None
+    custom_fields: Optional[SkipValidation[Dict[str, Any]]] = None
     customer: Optional["User"] = None
     assigned_user: Optional["User"] = None
     queue: Optional["Queue"] = None
@@ -42,7 +55,7 @@ class Ticket(BaseGoatflowModel):
     attachments: Optional[List["Attachment"]] = None
 
 
-class TicketMessage(BaseGoatflowModel):
+class TicketMessage(BaseGoatflowResponse):
     """Represents a message in a ticket."""
     
     id: int
@@ -55,10 +68,10 @@ class TicketMessage(BaseGoatflowModel):
     updated_at: datetime
     author: Optional["User"] = None
     attachments: Optional[List["Attachment"]] = None
-    custom_fields: Optional[Dict[str, Any]] = None
+    custom_fields: Optional[SkipValidation[Dict[str, Any]]] = None
 
 
-class User(BaseGoatflowModel):
+class User(BaseGoatflowResponse):
     """Represents a user in the system."""
     
     id: int
@@ -74,7 +87,7 @@ class User(BaseGoatflowModel):
     last_login_at: datetime
 
 
-class Queue(BaseGoatflowModel):
+class Queue(BaseGoatflowResponse):
     """Represents a ticket queue."""
     
     id: int
@@ -85,7 +98,7 @@ class Queue(BaseGoatflowModel):
     updated_at: datetime
 
 
-class Attachment(BaseGoatflowModel):
+class Attachment(BaseGoatflowResponse):
     """Represents a file attachment."""
     
     id: int
@@ -98,7 +111,7 @@ class Attachment(BaseGoatflowModel):
     created_at: datetime
 
 
-class Group(BaseGoatflowModel):
+class Group(BaseGoatflowResponse):
     """Represents a user group."""
     
     id: int
@@ -110,7 +123,7 @@ class Group(BaseGoatflowModel):
     updated_at: datetime
 
 
-class DashboardStats(BaseGoatflowModel):
+class DashboardStats(BaseGoatflowResponse):
     """Represents dashboard statistics."""
     
     total_tickets: int
@@ -120,12 +133,12 @@ class DashboardStats(BaseGoatflowModel):
     overdue_tickets: int
     unassigned_tickets: int
     my_tickets: int
-    tickets_by_status: Dict[str, int]
-    tickets_by_priority: Dict[str, int]
-    tickets_by_queue: Dict[str, int]
+    tickets_by_status: SkipValidation[Dict[str, int]]
+    tickets_by_priority: SkipValidation[Dict[str, int]]
+    tickets_by_queue: SkipValidation[Dict[str, int]]
 
 
-class SearchResult(BaseGoatflowModel):
+class SearchResult(BaseGoatflowResponse):
     """Represents search results."""
     
     total_count: int
@@ -134,7 +147,7 @@ class SearchResult(BaseGoatflowModel):
     tickets: List[Ticket]
 
 
-class InternalNote(BaseGoatflowModel):
+class InternalNote(BaseGoatflowResponse):
     """Represents an internal note."""
     
     id: int
@@ -153,7 +166,7 @@ class InternalNote(BaseGoatflowModel):
     edited_by: int
 
 
-class NoteTemplate(BaseGoatflowModel):
+class NoteTemplate(BaseGoatflowResponse):
     """Represents a note template."""
     
     id: int
@@ -167,7 +180,7 @@ class NoteTemplate(BaseGoatflowModel):
     updated_at: datetime
 
 
-class LDAPUser(BaseGoatflowModel):
+class LDAPUser(BaseGoatflowResponse):
     """Represents a user from LDAP."""
     
     dn: str
@@ -188,7 +201,7 @@ class LDAPUser(BaseGoatflowModel):
     is_active: bool
 
 
-class LDAPSyncResult(BaseGoatflowModel):
+class LDAPSyncResult(BaseGoatflowResponse):
     """Represents the result of an LDAP sync operation."""
     
     users_found: int
@@ -205,7 +218,7 @@ class LDAPSyncResult(BaseGoatflowModel):
     dry_run: bool
 
 
-class Webhook(BaseGoatflowModel):
+class Webhook(BaseGoatflowResponse):
     """Represents a webhook configuration."""
     
     id: int
@@ -222,7 +235,7 @@ class Webhook(BaseGoatflowModel):
     last_fired_at: Optional[datetime] = None
 
 
-class WebhookDelivery(BaseGoatflowModel):
+class WebhookDelivery(BaseGoatflowResponse):
     """Represents a webhook delivery attempt."""
     
     id: int
@@ -284,7 +297,7 @@ class TicketListOptions(BaseGoatflowModel):
     sort_order: Optional[str] = "desc"
 
 
-class TicketListResponse(BaseGoatflowModel):
+class TicketListResponse(BaseGoatflowResponse):
     """Response model for listing tickets."""
     
     tickets: List[Ticket]
@@ -333,7 +346,7 @@ class AuthLoginRequest(BaseGoatflowModel):
     password: str
 
 
-class AuthLoginResponse(BaseGoatflowModel):
+class AuthLoginResponse(BaseGoatflowResponse):
     """Response model for authentication."""
     
     token: str
@@ -342,7 +355,7 @@ class AuthLoginResponse(BaseGoatflowModel):
     user: User
 
 
-class APIResponse(BaseGoatflowModel):
+class APIResponse(BaseGoatflowResponse):
     """Standard API response wrapper."""
     
     success: bool
@@ -351,7 +364,7 @@ class APIResponse(BaseGoatflowModel):
     message: Optional[str] = None
 
 
-class ErrorResponse(BaseGoatflowModel):
+class ErrorResponse(BaseGoatflowResponse):
     """API error response."""
     
     error: str
@@ -362,15 +375,10 @@ class ErrorResponse(BaseGoatflowModel):
 # Update forward references
 Ticket.model_rebuild()
 TicketMessage.model_rebuild()
-User.model_rebuild()
-Queue.model_rebuild()
-Attachment.model_rebuild()
-Group.model_rebuild()
-DashboardStats.model_rebuild()
 SearchResult.model_rebuild()
-InternalNote.model_rebuild()
-NoteTemplate.model_rebuild()
-LDAPUser.model_rebuild()
-LDAPSyncResult.model_rebuild()
-Webhook.model_rebuild()
-WebhookDelivery.model_rebuild()
\ No newline at end of file
+
+
+# Prebuilt validators for hot response shapes; use validate_json() on raw bytes
+TicketListAdapter: TypeAdapter[TicketListResponse] = TypeAdapter(TicketListResponse)
+TicketListTicketsAdapter: TypeAdapter[List[Ticket]] = TypeAdapter(List[Ticket])
+UserAdapter: TypeAdapter[User] = TypeAdapter(User)
@@ -1,15 +1,21 @@
 const { chromium } = require('playwright');
 
+// Screenshots are taken on failure only unless SCREENSHOTS=all
+const captureMode = process.env.SCREENSHOTS || 'onfail';
+
 (async () => {
   const browser = await chromium.launch({ 
     headless: true,
-    args: ['--no-sandbox', '--disable-setuid-sandbox']
+    args: ['--no-sandbox', '--disable-setuid-sandbox', '--blink-settings=imagesEnabled=false']
   });
   
   const context = await browser.newContext({
     ignoreHTTPSErrors: true
   });
   
+  // Images and web fonts play no part in the assertions; don't fetch them
+  await context.route(/\.(png|jpe?g|gif|webp|ico|woff2?|ttf|otf)(\?.*)?$/, route => route.abort());
+  
   const page = await context.newPage();
   
   try {
@@ -17,7 +23,7 @@ const { chromium } = require('playwright');
     
     // Navigate to login
     console.log('1. Navigating to login page...');
-    await page.goto('http://nginx/login');
+    await page.goto('http://nginx/login', { waitUntil: 'domcontentloaded' });
     
     // Login
     console.log('2. Logging in as admin...');
@@ -29,13 +35,13 @@ const { chromium } = require('playwright');
     
     // Navigate to roles
     console.log('\n3. Navigating to Admin Roles...');
-    await page.goto('http://nginx/admin/roles');
-    await page.waitForSelector('table', { timeout: 5000 });
+    await page.goto('http://nginx/admin/roles', { waitUntil: 'domcontentloaded' });
+    await page.waitForSelector('[data-testid="role-row"]', { timeout: 5000 });
     console.log('   ✅ Roles page loaded');
     
     // Check roles list
     console.log('\n4. Checking roles list...');
-    const roles = await page.$$eval('tbody tr', rows => 
+    const roles = await page.$$eval('[data-testid="role-row"]', rows => 
       rows.map(row => ({
         name: row.querySelector('td:first-child')?.textContent?.trim(),
         status: row.querySelector('td:nth-child(4) span')?.textContent?.trim()
@@ -49,7 +55,7 @@ const { chromium } = require('playwright');
     
     // Test edit functionality
     console.log('\n5. Testing edit functionality...');
-    await page.click('tbody tr:first-child button[title="Edit role"]');
+    await page.click('[data-testid="role-edit"] >> nth=0');
     await page.waitForSelector('#roleModal:not(.hidden)', { timeout: 5000 });
     
     const roleName = await page.inputValue('#roleName');
@@ -67,29 +73,25 @@ const { chromium } = require('playwright');
     
     // Test membership management
     console.log('\n6. Testing membership management...');
-    await page.click('tbody tr:first-child button[title="Manage users"]');
+    await page.click('[data-testid="role-manage-users"] >> nth=0');
     await page.waitForSelector('#roleUsersModal:not(.hidden)', { timeout: 5000 });
     console.log('   ✅ Membership modal opened');
     
-    // Check available users
-    const availableUsers = await page.$$eval(
-      '#availableUsersList li', 
-      items => items.length
-    );
+    // Count available users and current members in one round-trip
+    const { availableUsers, currentMembers } = await page.evaluate(() => ({
+      availableUsers: document.querySelectorAll('#availableUsersList li').length,
+      currentMembers: document.querySelectorAll('#currentMembersList li').length
+    }));
     console.log(`   Available users: ${availableUsers}`);
-    
-    // Check current members
-    const currentMembers = await page.$$eval(
-      '#currentMembersList li', 
-      items => items.length
-    );
     console.log(`   Current members: ${currentMembers}`);
     
-    await page.screenshot({ 
-      path: '/test-results/admin-roles-membership.png',
-      fullPage: true 
-    });
-    console.log('   📸 Screenshot saved: admin-roles-membership.png');
+    if (captureMode === 'all') {
+      await page.screenshot({ 
+        path: '/test-results/admin-roles-membership.png',
+        fullPage: true 
+      });
+      console.log('   📸 Screenshot saved: admin-roles-membership.png');
+    }
     
     console.log('\n✅ All tests passed!');
     